@@ -184,7 +184,7 @@ class BinningCP:
 
         n = len(n_nonevent)
         n_records = n_nonevent + n_event
-        n_scenarios = len(w)
+        n_scenarios = n_nonevent.shape[1]
 
         if w is not None:
             sw = 10 ** np.abs(np.log10(np.min(w)))
@@ -196,11 +196,22 @@ class BinningCP:
         # Decision variables
         x, y, t, d = self.decision_variables_scenarios(model, n)
 
-        # Objective function
-        model.Maximize(sum([w[s] * sum([(V[s][i][i] * x[i, i]) +
-                            sum([(V[s][i][j] - V[s][i][j+1]) * x[i, j]
-                                 for j in range(i)]) for i in range(n)])
-                            for s in range(n_scenarios)]))
+        # Objective function: aggregate scenario coefficients so that each
+        # decision variable appears once in the objective.
+        VS = np.zeros((n_scenarios, n, n + 1), dtype=np.int64)
+        for s in range(n_scenarios):
+            for i in range(n):
+                VS[s, i, :i + 1] = V[s][i]
+
+        C = VS[:, :, :-1] - VS[:, :, 1:]
+
+        if w is None:
+            C = C.sum(axis=0)
+        else:
+            C = np.tensordot(np.asarray(w, dtype=np.int64), C, axes=1)
+
+        model.Maximize(sum([C[i, j] * x[i, j] for i in range(n)
+                            for j in range(i + 1)]))
 
         # Constraint: unique assignment
         self.add_constraint_unique_assignment(model, n, x)
@@ -262,8 +273,11 @@ class BinningCP:
         self._x = x
         self._n = n
 
-    def solve(self):
+    def solve(self, n_jobs=None):
         self.solver_ = cp_model.CpSolver()
+        if n_jobs is not None:
+            self.solver_.parameters.num_workers = n_jobs
+
         self.solver_.parameters.max_time_in_seconds = self.time_limit
 
         status = self.solver_.Solve(self._model)
@@ -271,9 +285,9 @@ class BinningCP:
 
         if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             solution = np.array([self.solver_.BooleanValue(self._x[i, i])
-                                 for i in range(self._n)]).astype(bool)
+                                 for i in range(self._n)], dtype=bool)
         else:
-            solution = np.zeros(self._n).astype(bool)
+            solution = np.zeros(self._n, dtype=bool)
             solution[-1] = True
 
         return status_name, solution
@@ -11,19 +11,26 @@ import time
 
 import numpy as np
 
+from joblib import delayed
+from joblib import effective_n_jobs
+from joblib import Parallel
 from sklearn.utils import check_array
 
 from ...information import solver_statistics
 from ...logging import Logger
 from ...binning.preprocessing import split_data_scenarios
 from ..binning import OptimalBinning
-from ..binning_statistics import bin_info
 from ..binning_statistics import BinningTable
-from ..binning_statistics import target_info
 from ..cp import BinningCP
 from ..prebinning import PreBinning
 from ..transformations import transform_binary_target
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 logger = Logger(__name__).logger
 
@@ -33,7 +40,7 @@ def _check_parameters(name, prebinning_method, max_n_prebins, min_prebin_size,
                       monotonic_trend, min_event_rate_diff, max_pvalue,
                       max_pvalue_policy, class_weight, user_splits,
                       user_splits_fixed, special_codes, split_digits,
-                      time_limit, verbose):
+                      n_jobs, time_limit, verbose):
 
     if not isinstance(name, str):
         raise TypeError("name must be a string.")
@@ -125,7 +132,8 @@ def _check_parameters(name, prebinning_method, max_n_prebins, min_prebin_size,
             if not isinstance(user_splits_fixed, (np.ndarray, list)):
                 raise TypeError("user_splits_fixed must be a list or "
                                 "numpy.ndarray.")
-            elif not all(isinstance(s, bool) for s in user_splits_fixed):
+            elif (len(user_splits_fixed) and
+                    np.asarray(user_splits_fixed).dtype != bool):
                 raise ValueError("user_splits_fixed must be list of boolean.")
             elif len(user_splits) != len(user_splits_fixed):
                 raise ValueError("Inconsistent length of user_splits and "
@@ -143,6 +151,11 @@ def _check_parameters(name, prebinning_method, max_n_prebins, min_prebin_size,
             raise ValueError("split_digits must be an integer in [0, 8]; "
                              "got {}.".format(split_digits))
 
+    if n_jobs is not None:
+        if not isinstance(n_jobs, numbers.Integral):
+            raise ValueError("n_jobs must be an integer or None; got {}."
+                             .format(n_jobs))
+
     if not isinstance(time_limit, numbers.Number) or time_limit < 0:
         raise ValueError("time_limit must be a positive value in seconds; "
                          "got {}.".format(time_limit))
@@ -172,6 +185,64 @@ def _check_X_Y_weights(X, Y, weights):
                              .format(n_scenarios_x, n_weights))
 
 
+def _is_checked(params, params_checked):
+    # Mutable parameters (lists, arrays, dicts) can be modified in place
+    # between fits, therefore they are always checked again.
+    if params_checked is None:
+        return False
+
+    return all(params[key] is value and
+               (value is None or isinstance(value, (str, numbers.Number)))
+               for key, value in params_checked.items())
+
+
+def _uniform_step(splits):
+    # Return the common step if splits are equally spaced, otherwise None.
+    if len(splits) < 2:
+        return None
+
+    step = splits[1] - splits[0]
+    if step > 0 and np.allclose(np.diff(splits), step, rtol=1e-6, atol=0):
+        return step
+
+    return None
+
+
+def _prebin_indices(x, splits, step=None):
+    # Equivalent to np.digitize(x, splits, right=False). For equally spaced
+    # splits, the indices are computed arithmetically in O(n) instead of
+    # using a binary search per element.
+    if step is None:
+        return np.searchsorted(splits, x, side="right")
+
+    n_splits = len(splits)
+
+    t = np.floor((x - splits[0]) / step)
+    np.clip(t, -1, n_splits - 1, out=t)
+    indices = t.astype(np.int64) + 1
+
+    # Fix values on a split point assigned to the adjacent bin due to
+    # floating-point rounding.
+    lower = np.take(splits, indices - 1, mode="clip")
+    upper = np.take(splits, indices, mode="clip")
+    indices -= (indices > 0) & (x < lower)
+    indices += (indices < n_splits) & (x >= upper)
+
+    return indices
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _count_prebins(x, y, splits, n_nonevent, n_event, s):
+        # Single pass over the samples of scenario s.
+        for i in range(len(x)):
+            idx = np.searchsorted(splits, x[i], side="right")
+            if y[i]:
+                n_event[idx, s] += 1
+            else:
+                n_nonevent[idx, s] += 1
+
+
 class SBOptimalBinning(OptimalBinning):
     """Scenario-based stochastic optimal binning of a numerical variable with
     respect to a binary target.
@@ -255,6 +326,14 @@ class SBOptimalBinning(OptimalBinning):
         to 0, the split points are integers. If None, then all significant
         digits in the split points are considered.
 
+    n_jobs : int or None, optional (default=None)
+        Number of jobs to run in parallel. The prebins of each scenario are
+        computed in threads and the CP solver runs with ``n_jobs`` workers.
+        With 1 job the solver is single-threaded and deterministic; with more
+        jobs it might return a different solution with the same optimal
+        objective value. ``None`` means 1 thread for the prebins and the
+        solver default number of workers. ``-1`` means using all processors.
+
     time_limit : int (default=100)
         The maximum time in seconds to run the optimization solver.
 
@@ -267,7 +346,8 @@ class SBOptimalBinning(OptimalBinning):
                  min_event_rate_diff=0, max_pvalue=None,
                  max_pvalue_policy="consecutive", class_weight=None,
                  user_splits=None, user_splits_fixed=None, special_codes=None,
-                 split_digits=None, time_limit=100, verbose=False):
+                 split_digits=None, n_jobs=None, time_limit=100,
+                 verbose=False):
 
         self.name = name
         self.dtype = "numerical"
@@ -294,6 +374,7 @@ class SBOptimalBinning(OptimalBinning):
         self.special_codes = special_codes
         self.split_digits = split_digits
 
+        self.n_jobs = n_jobs
         self.time_limit = time_limit
 
         self.verbose = verbose
@@ -308,9 +389,14 @@ class SBOptimalBinning(OptimalBinning):
         self._n_event_missing = None
         self._n_nonevent_special = None
         self._n_event_special = None
+        self._n_nonevent_scenario = None
+        self._n_event_scenario = None
+        self._min_x_scenario = None
+        self._max_x_scenario = None
         self._problem_type = "classification"
         self._user_splits = user_splits
         self._user_splits_fixed = user_splits_fixed
+        self._params_checked = None
 
         # info
         self._binning_table = None
@@ -469,8 +555,14 @@ class SBOptimalBinning(OptimalBinning):
     def _fit(self, X, Y, weights, check_input):
         time_init = time.perf_counter()
 
-        # Check parameters and input arrays
-        _check_parameters(**self.get_params())
+        # Check parameters and input arrays. Skip parameters check if they
+        # are the same objects already checked in a previous fit.
+        params = self.get_params()
+
+        if not _is_checked(params, self._params_checked):
+            _check_parameters(**params)
+            self._params_checked = params
+
         _check_X_Y_weights(X, Y, weights)
 
         self._n_scenarios = len(X)
@@ -479,8 +571,6 @@ class SBOptimalBinning(OptimalBinning):
             logger.info("Optimal binning started.")
             logger.info("Options: check parameters.")
 
-        _check_parameters(**self.get_params())
-
         # Pre-processing
         if self.verbose:
             logger.info("Pre-processing started.")
@@ -491,8 +581,8 @@ class SBOptimalBinning(OptimalBinning):
         self._n_samples = sum(self._n_samples_scenario)
 
         if self.verbose:
-            logger.info("Pre-processing: number of samples: {}"
-                        .format(self._n_samples))
+            logger.info("Pre-processing: number of samples: %s",
+                        self._n_samples)
 
         [x_clean, y_clean, x_missing, y_missing, x_special, y_special,
          w] = split_data_scenarios(X, Y, weights, self.special_codes,
@@ -505,17 +595,17 @@ class SBOptimalBinning(OptimalBinning):
             n_missing = len(x_missing)
             n_special = len(x_special)
 
-            logger.info("Pre-processing: number of clean samples: {}"
-                        .format(n_clean))
+            logger.info("Pre-processing: number of clean samples: %s",
+                        n_clean)
 
-            logger.info("Pre-processing: number of missing samples: {}"
-                        .format(n_missing))
+            logger.info("Pre-processing: number of missing samples: %s",
+                        n_missing)
 
-            logger.info("Pre-processing: number of special samples: {}"
-                        .format(n_special))
+            logger.info("Pre-processing: number of special samples: %s",
+                        n_special)
 
-            logger.info("Pre-processing terminated. Time: {:.4f}s"
-                        .format(self._time_preprocessing))
+            logger.info("Pre-processing terminated. Time: %.4fs",
+                        self._time_preprocessing)
 
         # Pre-binning
         if self.verbose:
@@ -528,19 +618,27 @@ class SBOptimalBinning(OptimalBinning):
                 self.user_splits, ensure_2d=False, dtype=None,
                 force_all_finite=True)
 
-            if len(set(user_splits)) != len(user_splits):
-                raise ValueError("User splits are not unique.")
-
             sorted_idx = np.argsort(user_splits)
             user_splits = user_splits[sorted_idx]
 
+            if np.any(user_splits[1:] == user_splits[:-1]):
+                raise ValueError("User splits are not unique.")
+
             if self.user_splits_fixed is not None:
-                self.user_splits_fixed = np.asarray(
+                user_splits_fixed = np.asarray(
                     self.user_splits_fixed)[sorted_idx]
+            else:
+                user_splits_fixed = None
+
+            # Reset user splits updated during pre-binning refinement.
+            self._user_splits = user_splits
+            self._user_splits_fixed = user_splits_fixed
 
             splits, n_nonevent, n_event = self._prebinning_refinement(
                 user_splits, x_clean, y_clean, y_missing, y_special)
         else:
+            self._user_splits_fixed = None
+
             splits, n_nonevent, n_event = self._fit_prebinning(
                 w, x_clean, y_clean, y_missing, y_special, self.class_weight)
 
@@ -549,13 +647,13 @@ class SBOptimalBinning(OptimalBinning):
         self._time_prebinning = time.perf_counter() - time_prebinning
 
         if self.verbose:
-            logger.info("Pre-binning: number of prebins: {}"
-                        .format(self._n_prebins))
-            logger.info("Pre-binning: number of refinements: {}"
-                        .format(self._n_refinements))
+            logger.info("Pre-binning: number of prebins: %s",
+                        self._n_prebins)
+            logger.info("Pre-binning: number of refinements: %s",
+                        self._n_refinements)
 
-            logger.info("Pre-binning terminated. Time: {:.4f}s"
-                        .format(self._time_prebinning))
+            logger.info("Pre-binning terminated. Time: %.4fs",
+                        self._time_prebinning)
 
         # Optimization
         self._fit_optimizer(splits, n_nonevent, n_event, weights)
@@ -567,38 +665,41 @@ class SBOptimalBinning(OptimalBinning):
 
         time_postprocessing = time.perf_counter()
 
-        self._n_nonevent = 0
-        self._n_event = 0
-        self._binning_tables = []
-
-        min_x = np.inf
-        max_x = -np.inf
-
-        for s in range(self._n_scenarios):
-            min_xs = x_clean[s].min()
-            max_xs = x_clean[s].max()
-
-            if min_xs < min_x:
-                min_x = min_xs
-
-            if max_xs > max_x:
-                max_x = max_xs
-
-            s_n_nonevent, s_n_event = bin_info(
-                self._solution, n_nonevent[:, s], n_event[:, s],
-                self._n_nonevent_missing[s], self._n_event_missing[s],
-                self._n_nonevent_special[s], self._n_event_special[s], None,
-                None, [])
-
-            self._n_nonevent += s_n_nonevent
-            self._n_event += s_n_event
-
-            binning_table = BinningTable(
-                self.name, self.dtype, self.special_codes,
-                self._splits_optimal, s_n_nonevent, s_n_event, min_xs, max_xs,
-                None, None, self.user_splits)
-
-            self._binning_tables.append(binning_table)
+        if not len(splits):
+            n_event = np.array([[np.count_nonzero(ys) for ys in y_clean]])
+            n_nonevent = np.array([[len(ys) for ys in y_clean]]) - n_event
+
+        # Merge prebins into the optimal bins of all scenarios at once.
+        if len(self._solution):
+            idx_end = np.flatnonzero(self._solution)
+            idx_start = np.concatenate([[0], idx_end[:-1] + 1])
+            n_nonevent = np.add.reduceat(n_nonevent[:idx_end[-1] + 1],
+                                         idx_start, axis=0)
+            n_event = np.add.reduceat(n_event[:idx_end[-1] + 1], idx_start,
+                                      axis=0)
+
+        # Optimal bins, special and missing counts, one row per scenario.
+        # Scenario binning tables are built on demand from these counts.
+        self._n_nonevent_scenario = np.vstack(
+            [n_nonevent, self._n_nonevent_special,
+             self._n_nonevent_missing]).T.astype(np.int64, order="C")
+        self._n_event_scenario = np.vstack(
+            [n_event, self._n_event_special,
+             self._n_event_missing]).T.astype(np.int64, order="C")
+        self._binning_tables = {}
+
+        self._min_x_scenario = np.fromiter(
+            (xs.min() for xs in x_clean), dtype=np.float64,
+            count=self._n_scenarios)
+        self._max_x_scenario = np.fromiter(
+            (xs.max() for xs in x_clean), dtype=np.float64,
+            count=self._n_scenarios)
+
+        min_x = self._min_x_scenario.min()
+        max_x = self._max_x_scenario.max()
+
+        self._n_nonevent = self._n_nonevent_scenario.sum(axis=0)
+        self._n_event = self._n_event_scenario.sum(axis=0)
 
         self._binning_table = BinningTable(
             self.name, self.dtype, self.special_codes, self._splits_optimal,
@@ -608,14 +709,14 @@ class SBOptimalBinning(OptimalBinning):
         self._time_postprocessing = time.perf_counter() - time_postprocessing
 
         if self.verbose:
-            logger.info("Post-processing terminated. Time: {:.4f}s"
-                        .format(self._time_postprocessing))
+            logger.info("Post-processing terminated. Time: %.4fs",
+                        self._time_postprocessing)
 
         self._time_total = time.perf_counter() - time_init
 
         if self.verbose:
-            logger.info("Optimal binning terminated. Status: {}. Time: {:.4f}s"
-                        .format(self._status, self._time_total))
+            logger.info("Optimal binning terminated. Status: %s. Time: %.4fs",
+                        self._status, self._time_total)
 
         # Completed successfully
         self._is_fitted = True
@@ -624,14 +725,23 @@ class SBOptimalBinning(OptimalBinning):
 
     def _fit_prebinning(self, weights, x_clean, y_clean, y_missing, y_special,
                         class_weight=None):
-        x = []
-        y = []
-        for s in range(self._n_scenarios):
-            x.extend(x_clean[s])
-            y.extend(y_clean[s])
+        if self.prebinning_method == "uniform":
+            # Equal-width prebins only depend on the range of x. Compute it
+            # per scenario to avoid concatenating all scenarios.
+            min_x = min(xs.min() for xs in x_clean if len(xs))
+            max_x = max(xs.max() for xs in x_clean if len(xs))
+
+            if min_x == max_x:
+                splits = np.array([])
+            else:
+                splits = np.linspace(min_x, max_x,
+                                     self.max_n_prebins + 1)[1:-1]
 
-        x = np.array(x)
-        y = np.array(y)
+            return self._prebinning_refinement(splits, x_clean, y_clean,
+                                               y_missing, y_special)
+
+        x = np.concatenate(x_clean)
+        y = np.concatenate(y_clean)
 
         min_bin_size = int(np.ceil(self.min_prebin_size * self._n_samples))
 
@@ -646,17 +756,18 @@ class SBOptimalBinning(OptimalBinning):
 
     def _prebinning_refinement(self, splits_prebinning, x, y, y_missing,
                                y_special):
-        self._n_nonevent_special = []
-        self._n_event_special = []
-        self._n_nonevent_missing = []
-        self._n_event_missing = []
+        self._n_nonevent_special = np.empty(self._n_scenarios, dtype=np.int64)
+        self._n_event_special = np.empty(self._n_scenarios, dtype=np.int64)
+        self._n_nonevent_missing = np.empty(self._n_scenarios, dtype=np.int64)
+        self._n_event_missing = np.empty(self._n_scenarios, dtype=np.int64)
+
         for s in range(self._n_scenarios):
-            s_n_nonevent, s_n_event = target_info(y_special[s])
-            m_n_nonevent, m_n_event = target_info(y_missing[s])
-            self._n_nonevent_special.append(s_n_nonevent)
-            self._n_event_special.append(s_n_event)
-            self._n_nonevent_missing.append(m_n_nonevent)
-            self._n_event_missing.append(m_n_event)
+            s_n_event = np.count_nonzero(y_special[s])
+            m_n_event = np.count_nonzero(y_missing[s])
+            self._n_event_special[s] = s_n_event
+            self._n_nonevent_special[s] = len(y_special[s]) - s_n_event
+            self._n_event_missing[s] = m_n_event
+            self._n_nonevent_missing[s] = len(y_missing[s]) - m_n_event
 
         n_splits = len(splits_prebinning)
 
@@ -678,30 +789,50 @@ class SBOptimalBinning(OptimalBinning):
             return splits_prebinning, np.array([]), np.array([])
 
         n_bins = n_splits + 1
-        n_nonevent = np.empty((n_bins, self._n_scenarios)).astype(np.int64)
-        n_event = np.empty((n_bins, self._n_scenarios)).astype(np.int64)
-        mask_remove = np.zeros(n_bins).astype(bool)
+        # Column-major layout: the counts of each scenario are contiguous.
+        n_nonevent = np.zeros((n_bins, self._n_scenarios), dtype=np.int64,
+                              order="F")
+        n_event = np.zeros((n_bins, self._n_scenarios), dtype=np.int64,
+                           order="F")
+
+        if NUMBA_AVAILABLE:
+            def count_scenario(s):
+                _count_prebins(x[s], y[s], splits_prebinning, n_nonevent,
+                               n_event, s)
+        else:
+            step = _uniform_step(splits_prebinning)
 
-        for s in range(self._n_scenarios):
-            y0 = (y[s] == 0)
-            y1 = ~y0
+            def count_scenario(s):
+                indices = _prebin_indices(x[s], splits_prebinning, step)
+
+                n_event[:, s] = np.bincount(indices, weights=(y[s] != 0),
+                                            minlength=n_bins)
+                n_nonevent[:, s] = np.bincount(
+                    indices, minlength=n_bins) - n_event[:, s]
 
-            indices = np.digitize(x[s], splits_prebinning, right=False)
+        # Each scenario only writes its own column of the count matrices,
+        # no synchronization is required.
+        if self.n_jobs is None:
+            n_jobs = 1
+        else:
+            n_jobs = effective_n_jobs(self.n_jobs)
 
-            for i in range(n_bins):
-                mask = (indices == i)
-                n_nonevent[i, s] = np.count_nonzero(y0 & mask)
-                n_event[i, s] = np.count_nonzero(y1 & mask)
+        if n_jobs > 1:
+            Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(count_scenario)(s) for s in range(self._n_scenarios))
+        else:
+            for s in range(self._n_scenarios):
+                count_scenario(s)
 
-            mask_remove |= (n_nonevent[:, s] == 0) | (n_event[:, s] == 0)
+        mask_remove = np.any((n_nonevent == 0) | (n_event == 0), axis=1)
 
-        if np.any(mask_remove):
+        while np.any(mask_remove):
             self._n_refinements += 1
 
             mask_splits = np.concatenate(
                 [mask_remove[:-2], [mask_remove[-2] | mask_remove[-1]]])
 
-            if self.user_splits_fixed is not None:
+            if self._user_splits_fixed is not None:
                 user_splits_fixed = np.asarray(self._user_splits_fixed)
                 user_splits = np.asarray(self._user_splits)
                 fixed_remove = user_splits_fixed & mask_splits
@@ -716,14 +847,24 @@ class SBOptimalBinning(OptimalBinning):
                 self._user_splits_fixed = user_splits_fixed[~mask_splits]
                 self._user_splits = user_splits[~mask_splits]
 
-            splits = splits_prebinning[~mask_splits]
+            splits_prebinning = splits_prebinning[~mask_splits]
 
             if self.verbose:
-                logger.info("Pre-binning: number prebins removed: {}"
-                            .format(np.count_nonzero(mask_remove)))
+                logger.info("Pre-binning: number prebins removed: %s",
+                            np.count_nonzero(mask_remove))
+
+            if not len(splits_prebinning):
+                return splits_prebinning, np.array([]), np.array([])
+
+            # Removing a split merges its two adjacent prebins. Aggregate the
+            # counts of the merged prebins instead of recounting all samples.
+            idx_start = np.concatenate([[0], np.flatnonzero(~mask_splits) + 1])
+            n_nonevent = np.asfortranarray(
+                np.add.reduceat(n_nonevent, idx_start, axis=0))
+            n_event = np.asfortranarray(
+                np.add.reduceat(n_event, idx_start, axis=0))
 
-            [splits_prebinning, n_nonevent, n_event] = self._compute_prebins(
-                splits, x, y)
+            mask_remove = np.any((n_nonevent == 0) | (n_event == 0), axis=1)
 
         return splits_prebinning, n_nonevent, n_event
 
@@ -733,7 +874,10 @@ class SBOptimalBinning(OptimalBinning):
         if not len(n_nonevent):
             self._status = "OPTIMAL"
             self._splits_optimal = splits
-            self._solution = np.zeros(len(splits)).astype(bool)
+            self._solution = np.zeros(len(splits), dtype=bool)
+            self._optimizer = None
+            self._time_optimizer = 0
+            self._time_solver = time.perf_counter() - time_init
 
             if self.verbose:
                 logger.warning("Optimizer: no bins after pre-binning.")
@@ -742,17 +886,17 @@ class SBOptimalBinning(OptimalBinning):
                 logger.info("Optimizer terminated. Time: 0s")
             return
 
+        n_samples_scenario = np.asarray(self._n_samples_scenario)
+
         if self.min_bin_size is not None:
-            min_bin_size = [int(np.ceil(
-                self.min_bin_size * self._n_samples_scenario[s]))
-                for s in range(self._n_scenarios)]
+            min_bin_size = np.ceil(self.min_bin_size * n_samples_scenario
+                                   ).astype(np.int64).tolist()
         else:
             min_bin_size = self.min_bin_size
 
         if self.max_bin_size is not None:
-            max_bin_size = [int(np.ceil(
-                self.max_bin_size * self._n_samples_scenario[s]))
-                for s in range(self._n_scenarios)]
+            max_bin_size = np.ceil(self.max_bin_size * n_samples_scenario
+                                   ).astype(np.int64).tolist()
         else:
             max_bin_size = self.max_bin_size
 
@@ -760,16 +904,21 @@ class SBOptimalBinning(OptimalBinning):
                               self.max_n_bins, min_bin_size, max_bin_size,
                               None, None, None, None, self.min_event_rate_diff,
                               self.max_pvalue, self.max_pvalue_policy, None,
-                              self.user_splits_fixed, self.time_limit)
-        if weights is None:
-            weights = np.ones(self._n_scenarios, int)
+                              self._user_splits_fixed, self.time_limit)
+        # Number of threads. If None, use the solver default.
+        if self.n_jobs is None:
+            n_jobs = None
+        else:
+            n_jobs = effective_n_jobs(self.n_jobs)
 
         if self.verbose:
+            if n_jobs is not None:
+                logger.info("Optimizer: %s jobs.", n_jobs)
             logger.info("Optimizer: build model...")
 
         optimizer.build_model_scenarios(n_nonevent, n_event, weights)
 
-        status, solution = optimizer.solve()
+        status, solution = optimizer.solve(n_jobs)
 
         if self.verbose:
             logger.info("Optimizer: solve...")
@@ -780,13 +929,14 @@ class SBOptimalBinning(OptimalBinning):
             self.solver, optimizer.solver_)
         self._status = status
 
-        self._splits_optimal = splits[solution[:-1]]
+        self._splits_optimal = np.compress(
+            solution[:-1], splits).astype(np.float64, copy=False)
 
         self._time_solver = time.perf_counter() - time_init
 
         if self.verbose:
-            logger.info("Optimizer terminated. Time: {:.4f}s"
-                        .format(self._time_solver))
+            logger.info("Optimizer terminated. Time: %.4fs",
+                        self._time_solver)
 
     def binning_table_scenario(self, scenario_id):
         """Return the instantiated binning table corresponding to
@@ -808,7 +958,20 @@ class SBOptimalBinning(OptimalBinning):
             raise ValueError("scenario_id must be < {}; got {}."
                              .format(self._n_scenarios, scenario_id))
 
-        return self._binning_tables[scenario_id]
+        binning_table = self._binning_tables.get(scenario_id)
+
+        if binning_table is None:
+            binning_table = BinningTable(
+                self.name, self.dtype, self.special_codes,
+                self._splits_optimal, self._n_nonevent_scenario[scenario_id],
+                self._n_event_scenario[scenario_id],
+                self._min_x_scenario[scenario_id],
+                self._max_x_scenario[scenario_id], None, None,
+                self.user_splits)
+
+            self._binning_tables[scenario_id] = binning_table
+
+        return binning_table
 
     @property
     def splits(self):
@@ -128,6 +128,7 @@ sboptimal_binning_default_options = {
     "user_splits_fixed": None,
     "special_codes": None,
     "split_digits": None,
+    "n_jobs": None,
     "time_limit": 100,
     "verbose": False
 }
@@ -68,6 +68,7 @@ tests_require = [
 # extra requirements
 extras_require = {
     'distributed': ['pympler', 'tdigest'],
+    'numba': ['numba'],
 }
 
 
@@ -11,6 +11,8 @@ import pandas as pd
 from pytest import approx, raises
 
 from optbinning.binning.binning_statistics import BinningTable
+from optbinning.binning.cp import BinningCP
+from optbinning.binning.uncertainty import binning_scenarios
 from optbinning.binning.uncertainty import SBOptimalBinning
 from sklearn.datasets import load_breast_cancer
 from sklearn.exceptions import NotFittedError
@@ -125,6 +127,10 @@ def test_params():
         sboptb = SBOptimalBinning(split_digits=9)
         sboptb.fit(x_s, y_s)
 
+    with raises(ValueError):
+        sboptb = SBOptimalBinning(n_jobs=1.5)
+        sboptb.fit(x_s, y_s)
+
     with raises(ValueError):
         sboptb = SBOptimalBinning(time_limit=-2)
         sboptb.fit(x_s, y_s)
@@ -134,6 +140,28 @@ def test_params():
         sboptb.fit(x_s, y_s)
 
 
+def test_params_refit():
+    sboptb = SBOptimalBinning()
+    sboptb.fit(x_s, y_s)
+
+    with raises(ValueError):
+        sboptb.set_params(max_n_prebins=-2)
+        sboptb.fit(x_s, y_s)
+
+
+def test_params_refit_inplace():
+    user_splits = [11, 12, 13, 14, 15, 16, 17]
+    user_splits_fixed = [False, False, False, False, True, False, False]
+
+    sboptb = SBOptimalBinning(user_splits=user_splits,
+                              user_splits_fixed=user_splits_fixed)
+    sboptb.fit(x_s, y_s)
+
+    with raises(ValueError):
+        user_splits_fixed[4] = "yes"
+        sboptb.fit(x_s, y_s)
+
+
 def test_input_scenarios():
     with raises(TypeError):
         sboptb = SBOptimalBinning()
@@ -178,6 +206,112 @@ def test_default_fit_transform():
                                   2.8963411], rel=1e-6)
 
 
+def test_weights():
+    sboptb = SBOptimalBinning(monotonic_trend="descending")
+    sboptb.fit(x_s, y_s, weights=[1, 2, 0.5])
+
+    assert sboptb.status == "OPTIMAL"
+    assert sboptb.splits == approx([13.09499979, 14.14999962, 15.24499989],
+                                   rel=1e-6)
+
+    # fixed prebins: scenario weights only enter the objective function
+    x_w = [x1, x2 + 1]
+    y_w = [y1, y2]
+
+    sboptb = SBOptimalBinning(user_splits=[11, 12, 13, 14, 15, 16, 17],
+                              max_n_bins=3)
+
+    sboptb.fit(x_w, y_w)
+    assert sboptb.splits == approx([13, 17])
+
+    sboptb.fit(x_w, y_w, weights=[0.9, 0.1])
+    assert sboptb.splits == approx([13, 17])
+
+    sboptb.fit(x_w, y_w, weights=[0.1, 0.9])
+    assert sboptb.splits == approx([14, 17])
+
+
+def test_prebinning_uniform():
+    sboptb = SBOptimalBinning(prebinning_method="uniform",
+                              monotonic_trend="descending")
+    sboptb.fit(x_s, y_s)
+
+    grid = np.linspace(x1.min(), x1.max(), 21)[1:-1]
+
+    assert sboptb.status == "OPTIMAL"
+    assert np.all(np.isin(sboptb.splits, grid))
+
+
+def test_n_jobs():
+    sboptb = SBOptimalBinning(monotonic_trend="descending", n_jobs=2)
+    sboptb.fit(x_s, y_s)
+
+    assert sboptb.status == "OPTIMAL"
+    assert sboptb.splits == approx([13.09499979, 14.14999962, 15.24499989],
+                                   rel=1e-6)
+
+
+def test_n_jobs_solver_workers(monkeypatch):
+    num_workers = []
+    solve = BinningCP.solve
+
+    def solve_workers(self, n_jobs=None):
+        result = solve(self, n_jobs)
+        num_workers.append(self.solver_.parameters.num_workers)
+        return result
+
+    monkeypatch.setattr(BinningCP, "solve", solve_workers)
+
+    for n_jobs in (None, 1, 2):
+        sboptb = SBOptimalBinning(monotonic_trend="descending", n_jobs=n_jobs)
+        sboptb.fit(x_s, y_s)
+
+    # None keeps the solver default (all cores).
+    assert num_workers == [0, 1, 2]
+
+
+def test_prebin_indices():
+    rng = np.random.RandomState(42)
+
+    for min_x, max_x, n_prebins in [(0, 1, 20), (-3.7, 12.1, 7),
+                                    (6.981, 28.11, 50), (1e5, 1e5 + 1, 31)]:
+        splits = np.linspace(min_x, max_x, n_prebins + 1)[1:-1]
+        step = binning_scenarios._uniform_step(splits)
+
+        assert step is not None
+
+        x_test = np.concatenate([
+            splits, np.nextafter(splits, -np.inf),
+            np.nextafter(splits, np.inf), [min_x, max_x, -np.inf, np.inf],
+            rng.uniform(min_x - 1, max_x + 1, 1000)])
+
+        indices = binning_scenarios._prebin_indices(x_test, splits, step)
+        assert np.array_equal(indices, np.digitize(x_test, splits))
+
+    assert binning_scenarios._uniform_step(np.array([1., 2., 4.])) is None
+    assert binning_scenarios._uniform_step(np.array([1.])) is None
+
+
+def test_prebins_numpy(monkeypatch):
+    for prebinning_method in ("cart", "uniform"):
+        sboptb = SBOptimalBinning(prebinning_method=prebinning_method,
+                                  monotonic_trend="descending")
+        sboptb.fit(x_s, y_s)
+
+        monkeypatch.setattr(binning_scenarios, "NUMBA_AVAILABLE", False)
+        sboptb_numpy = SBOptimalBinning(prebinning_method=prebinning_method,
+                                        monotonic_trend="descending")
+        sboptb_numpy.fit(x_s, y_s)
+        monkeypatch.undo()
+
+        assert sboptb_numpy.splits == approx(sboptb.splits)
+
+        for s in range(len(x_s)):
+            bt = sboptb.binning_table_scenario(s).build()
+            bt_numpy = sboptb_numpy.binning_table_scenario(s).build()
+            pd.testing.assert_frame_equal(bt_numpy, bt)
+
+
 def test_user_splits():
     user_splits = [11, 12, 13, 14, 15, 16, 17]
 
@@ -211,6 +345,24 @@ def test_user_splits_fixed():
     assert sboptb.status == "OPTIMAL"
     assert 15.5 in sboptb.splits
 
+    sboptb.fit(x_s, y_s)
+
+    assert 15.5 in sboptb.splits
+
+    # unsorted user splits
+    user_splits = [17, 11, 15.5, 13, 14, 16, 12]
+    user_splits_fixed = [False, False, False, False, True, False, False]
+
+    sboptb = SBOptimalBinning(monotonic_trend="descending",
+                              user_splits=user_splits,
+                              user_splits_fixed=user_splits_fixed)
+
+    for _ in range(2):
+        sboptb.fit(x_s, y_s)
+
+        assert 14 in sboptb.splits
+        assert sboptb.user_splits_fixed == user_splits_fixed
+
 
 def test_min_bin_size():
     sboptb = SBOptimalBinning(monotonic_trend="descending", min_bin_size=0.1)
@@ -242,6 +394,23 @@ def test_max_bin_size():
         assert np.all(count <= 0.6)
 
 
+def test_no_prebins():
+    x_c = [np.ones(50), np.ones(40)]
+    y_c = [np.tile([0, 1], 25), np.tile([0, 1], 20)]
+
+    sboptb = SBOptimalBinning()
+    sboptb.fit(x_c, y_c)
+
+    assert sboptb.status == "OPTIMAL"
+    assert len(sboptb.splits) == 0
+
+    bt = sboptb.binning_table_scenario(1).build()
+    assert bt.loc[0, "Count"] == 40
+
+    x_transform = sboptb.transform([1, 1], metric="event_rate")
+    assert x_transform == approx([0.5, 0.5])
+
+
 def test_binning_table_scenario():
     sboptb = SBOptimalBinning(monotonic_trend="descending")
 